@@ -1,13 +1,19 @@
 import matplotlib.pyplot as plt
-import matplotlib.patches as patches
+import matplotlib.colors as mcolors
+import matplotlib.animation as animation
+from matplotlib.collections import EllipseCollection, LineCollection
+from matplotlib.font_manager import FontProperties
+from matplotlib.textpath import TextPath
+import numpy as np
 from collections import deque
 import math
-import time
 
 # --- 1. BST Data Structure ---
 
 class BSTNode:
     """Binary Search Tree Node"""
+    __slots__ = ('value', 'left', 'right', 'visit_order', 'is_visited')
+    
     def __init__(self, value):
         self.value = value
         self.left = None
@@ -24,49 +30,129 @@ class BST:
         """Insert a value into the BST following BST property: left < parent < right"""
         if self.root is None:
             self.root = BSTNode(value)
-        else:
-            self._insert_recursive(self.root, value)
-    
-    def _insert_recursive(self, node, value):
-        """Recursive helper for insert - maintains BST property"""
-        if value < node.value:
-            if node.left is None:
-                node.left = BSTNode(value)
-            else:
-                self._insert_recursive(node.left, value)
-        elif value > node.value:
-            if node.right is None:
-                node.right = BSTNode(value)
+            return
+        
+        node = self.root
+        while True:
+            if value < node.value:
+                if node.left is None:
+                    node.left = BSTNode(value)
+                    return
+                node = node.left
+            elif value > node.value:
+                if node.right is None:
+                    node.right = BSTNode(value)
+                    return
+                node = node.right
             else:
-                self._insert_recursive(node.right, value)
+                return
     
     def set_visit_order(self, visited_list_values):
         """Set visit order numbers for each node"""
         visited_dict = {value: order + 1 for order, value in enumerate(visited_list_values)}
-        self._set_visit_recursive(self.root, visited_dict)
-    
-    def _set_visit_recursive(self, node, visited_dict):
-        """Recursive helper to set visit order"""
-        if node is None:
-            return
-        if node.value in visited_dict:
-            node.visit_order = visited_dict[node.value]
-        self._set_visit_recursive(node.left, visited_dict)
-        self._set_visit_recursive(node.right, visited_dict)
+        for node in self.iter_nodes():
+            visit_order = visited_dict.get(node.value)
+            if visit_order is not None:
+                node.visit_order = visit_order
+    
+    def iter_nodes(self):
+        """Yield every node in pre-order (node, left subtree, right subtree) using an explicit stack"""
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            yield node
+            stack.append(node.right)
+            stack.append(node.left)
     
     def get_all_nodes(self):
         """Get all nodes in a list (for tracking)"""
+        return list(self.iter_nodes())
+    
+    def preorder_traversal(self):
+        """Values in pre-order (node, left, right)"""
+        return [node.value for node in self.iter_nodes()]
+    
+    def inorder_traversal(self):
+        """Values in in-order (left, node, right) using an explicit stack"""
         result = []
-        self._collect_nodes(self.root, result)
+        stack = []
+        node = self.root
+        while node is not None or stack:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            result.append(node.value)
+            node = node.right
         return result
     
-    def _collect_nodes(self, node, result):
-        """Recursively collect all nodes"""
-        if node is None:
-            return
-        result.append(node)
-        self._collect_nodes(node.left, result)
-        self._collect_nodes(node.right, result)
+    def postorder_traversal(self):
+        """Values in post-order (left, right, node): reversed node-right-left pre-order"""
+        result = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            result.append(node.value)
+            stack.append(node.left)
+            stack.append(node.right)
+        result.reverse()
+        return result
+    
+    def to_arrays(self):
+        """Flatten the tree into van Emde Boas ordered arrays (see flatten_tree)"""
+        return flatten_tree(self.root)
+
+
+def tree_height(root):
+    """Number of levels in the tree under root (0 for an empty tree)"""
+    height = 0
+    level = [root] if root is not None else []
+    while level:
+        height += 1
+        level = [child for node in level for child in (node.left, node.right) if child is not None]
+    return height
+
+
+def _veb_order(root, height, out):
+    """Append the top `height` levels under root to out in van Emde Boas order"""
+    if root is None:
+        return
+    if height == 1:
+        out.append(root)
+        return
+    
+    # Lay out the top half of the levels, then each bottom subtree contiguously
+    top = height // 2
+    _veb_order(root, top, out)
+    
+    bottom_roots = [root]
+    for _ in range(top):
+        bottom_roots = [child for node in bottom_roots
+                        for child in (node.left, node.right) if child is not None]
+    for subtree in bottom_roots:
+        _veb_order(subtree, height - top, out)
+
+
+def flatten_tree(root):
+    """
+    Flatten a tree into a structure-of-arrays layout.
+    
+    Returns:
+        (nodes, left, right) where nodes lists the BSTNodes in van Emde Boas
+        order (root first) and left/right are int32 arrays holding each
+        node's child index into nodes, or -1 when there is no child.
+    """
+    nodes = []
+    _veb_order(root, tree_height(root), nodes)
+    
+    index = {node: i for i, node in enumerate(nodes)}
+    left = np.array([index.get(node.left, -1) for node in nodes], dtype=np.int32)
+    right = np.array([index.get(node.right, -1) for node in nodes], dtype=np.int32)
+    return nodes, left, right
 
 # --- 2. Tree Construction Functions ---
 
@@ -79,25 +165,70 @@ def create_bst_from_all_nodes(all_nodes):
         return None
     
     # Sort the nodes
-    sorted_nodes = sorted(list(set(all_nodes)))
+    sorted_nodes = sorted(set(all_nodes))
     
-    def build_balanced_bst(node_list):
-        """Recursively build a balanced BST from sorted list using midpoint"""
-        if not node_list:
+    def build_balanced_bst(lo, hi):
+        """Recursively build a balanced BST from sorted_nodes[lo:hi] using midpoint"""
+        if lo >= hi:
             return None
         
         # Find the middle element
-        mid = len(node_list) // 2
-        node = BSTNode(node_list[mid])
+        mid = (lo + hi) // 2
+        node = BSTNode(sorted_nodes[mid])
         
-        # Recursively build left and right subtrees
-        node.left = build_balanced_bst(node_list[:mid])
-        node.right = build_balanced_bst(node_list[mid+1:])
+        # Recursively build left and right subtrees over index ranges (no slicing)
+        node.left = build_balanced_bst(lo, mid)
+        node.right = build_balanced_bst(mid + 1, hi)
         
         return node
     
     bst = BST()
-    bst.root = build_balanced_bst(sorted_nodes)
+    bst.root = build_balanced_bst(0, len(sorted_nodes))
+    return bst
+
+
+def _build_tree_from_visited_order(visited_order, root_value, record_visit_order=False):
+    """
+    Single-pass builder shared by the visited-order tree constructors.
+    
+    Each entry is a (node, parent) tuple or a bare node value. A node is
+    placed once, under the first parent that reached it and only if that
+    parent is already in the tree, so re-popped nodes (e.g. re-expanded by
+    A*) can never make the tree cyclic. Children fill left then right;
+    further children are dropped (BST limitation for n-ary trees).
+    """
+    root = None
+    node_map = {}
+    
+    for idx, node_info in enumerate(visited_order):
+        node, parent = node_info if isinstance(node_info, tuple) else (node_info, None)
+        if node in node_map:
+            continue
+        
+        if node == root_value:
+            tree_node = BSTNode(node)
+            root = tree_node
+        else:
+            parent_node = node_map.get(parent)
+            if parent_node is None:
+                continue
+            tree_node = BSTNode(node)
+            if parent_node.left is None:
+                parent_node.left = tree_node
+            elif parent_node.right is None:
+                parent_node.right = tree_node
+            else:
+                continue
+        
+        if record_visit_order:
+            tree_node.visit_order = idx + 1
+        node_map[node] = tree_node
+    
+    if root is None:
+        return None
+    
+    bst = BST()
+    bst.root = root
     return bst
 
 
@@ -115,40 +246,7 @@ def create_exploration_tree_from_visited_order(visited_order, start_node):
     if not visited_order:
         return None
     
-    bst = BST()
-    
-    # Create a map of node_value -> BSTNode for quick lookup
-    node_map = {}
-    
-    # First pass: Create all nodes and set the root
-    for node, parent in visited_order:
-        if node not in node_map:
-            node_map[node] = BSTNode(node)
-    
-    bst.root = node_map.get(start_node)
-    if not bst.root:
-        return None
-    
-    # Second pass: Build parent-child relationships
-    for node, parent in visited_order:
-        if parent is None:
-            # This is the root
-            continue
-        
-        child_node = node_map.get(node)
-        parent_node = node_map.get(parent)
-        
-        if child_node and parent_node:
-            # Add child to parent (simple binary approach: left/right alternating)
-            if parent_node.left is None:
-                parent_node.left = child_node
-            elif parent_node.right is None:
-                parent_node.right = child_node
-            else:
-                # For more than 2 children, add to left (BST limitation for n-ary trees)
-                pass
-    
-    return bst
+    return _build_tree_from_visited_order(visited_order, start_node)
 
 
 def create_bst_from_visited_order(visited_order):
@@ -158,30 +256,10 @@ def create_bst_from_visited_order(visited_order):
     if not visited_order:
         return None
     
-    bst = BST()
-    node_map = {}
-    
-    for idx, node_info in enumerate(visited_order):
-        if isinstance(node_info, tuple):
-            node, parent = node_info
-        else:
-            node = node_info
-            parent = None
-        
-        new_bst_node = BSTNode(node)
-        new_bst_node.visit_order = idx + 1
-        node_map[node] = new_bst_node
-        
-        if bst.root is None:
-            bst.root = new_bst_node
-        elif parent and parent in node_map:
-            parent_node = node_map[parent]
-            if parent_node.left is None:
-                parent_node.left = new_bst_node
-            else:
-                parent_node.right = new_bst_node
-    
-    return bst
+    first = visited_order[0]
+    root_value = first[0] if isinstance(first, tuple) else first
+    return _build_tree_from_visited_order(visited_order, root_value, record_visit_order=True)
+
 
 # --- 3. Layout and Drawing Functions ---
 
@@ -189,135 +267,283 @@ def calculate_tree_layout(node, x=0, y=0, dx=150):
     """
     Calculate positions for tree nodes.
     FIXED: Proper parameter names (x, y, dx)
+    The tree is flattened once (flatten_tree) and laid out by
+    layout_tree_arrays, so no recursion is involved.
     """
     if node is None:
         return []
     
-    dy = 120
-    positions = [(node.value, x, y)]
-    
-    if node.left is not None:
-        left_width = get_subtree_width(node.left)
-        left_x = x - dx - (left_width * dx) / 2
-        left_positions = calculate_tree_layout(node.left, left_x, y - dy, dx * 0.8)
-        positions.extend(left_positions)
-    
-    if node.right is not None:
-        right_width = get_subtree_width(node.right)
-        right_x = x + dx + (right_width * dx) / 2
-        right_positions = calculate_tree_layout(node.right, right_x, y - dy, dx * 0.8)
-        positions.extend(right_positions)
-    
-    return positions
+    nodes, left, right = flatten_tree(node)
+    xs, ys = layout_tree_arrays(left, right, x, y, dx)
+    return [(tree_node.value, x, y) for tree_node, x, y in zip(nodes, xs.tolist(), ys.tolist())]
 
 
-def get_subtree_width(node):
-    """Calculate the width of a subtree"""
-    if node is None:
-        return 0
-    
-    if node.left is None and node.right is None:
-        return 1
+def layout_tree_arrays(left, right, x=0, y=0, dx=150, dy=120, shrink=0.8):
+    """
+    Tree layout kernel over flatten_tree index arrays (root at index 0,
+    every parent stored before its children).
     
-    left_width = get_subtree_width(node.left)
-    right_width = get_subtree_width(node.right)
+    Subtree widths are filled in one reverse sweep (children before
+    parents), then positions in one forward sweep. Each child sits
+    dx + width * dx / 2 to the side of its parent, one level (dy) lower,
+    with dx shrinking by `shrink` per level.
     
-    return left_width + right_width if (left_width + right_width) > 0 else 1
+    Returns:
+        (xs, ys) float arrays aligned with the flattened node order
+    """
+    left = left.tolist()
+    right = right.tolist()
+    n = len(left)
+    if n == 0:
+        return np.empty(0), np.empty(0)
+    
+    widths = subtree_widths_arrays(left, right)
+    
+    xs = [0.0] * n
+    ys = [0.0] * n
+    dxs = [0.0] * n
+    xs[0], ys[0], dxs[0] = x, y, dx
+    for i in range(n):
+        d = dxs[i]
+        l, r = left[i], right[i]
+        if l >= 0:
+            xs[l] = xs[i] - d - (widths[l] * d) / 2
+            ys[l] = ys[i] - dy
+            dxs[l] = d * shrink
+        if r >= 0:
+            xs[r] = xs[i] + d + (widths[r] * d) / 2
+            ys[r] = ys[i] - dy
+            dxs[r] = d * shrink
+    
+    return np.array(xs), np.array(ys)
 
 
-def draw_tree_edges(ax, node, positions_dict, color='#AABBC3', linewidth=2.0):
-    """Draw edges between tree nodes"""
-    if node is None or node.value not in positions_dict:
-        return
-    
-    x, y = positions_dict[node.value]
+def layout_to_arrays(positions):
+    """Split calculate_tree_layout output into (values, xs, ys) with NumPy coordinate arrays"""
+    values = [value for value, _, _ in positions]
+    xs = np.fromiter((x for _, x, _ in positions), dtype=float, count=len(positions))
+    ys = np.fromiter((y for _, _, y in positions), dtype=float, count=len(positions))
+    return values, xs, ys
 
-    if node.left is not None and node.left.value in positions_dict:
-        x_child, y_child = positions_dict[node.left.value]
-        ax.plot([x, x_child], [y, y_child], '-', linewidth=linewidth,
-                color=color, zorder=1, alpha=0.7)
-        draw_tree_edges(ax, node.left, positions_dict, color, linewidth)
-    
-    if node.right is not None and node.right.value in positions_dict:
-        x_child, y_child = positions_dict[node.right.value]
-        ax.plot([x, x_child], [y, y_child], '-', linewidth=linewidth,
-                color=color, zorder=1, alpha=0.7)
-        draw_tree_edges(ax, node.right, positions_dict, color, linewidth)
+
+def subtree_widths_arrays(left, right):
+    """
+    Width of every subtree over flatten_tree child indices, in one reverse
+    sweep (children before parents). A leaf is 1 wide; any other node is
+    as wide as its children combined.
+    """
+    widths = [1] * len(left)
+    for i in range(len(left) - 1, -1, -1):
+        l, r = left[i], right[i]
+        if l >= 0 or r >= 0:
+            widths[i] = (widths[l] if l >= 0 else 0) + (widths[r] if r >= 0 else 0)
+    return widths
+
+
+# Node circle styles as precomputed (facecolor RGBA, edgecolor RGBA, linewidth) rows
+NODE_STYLE = (mcolors.to_rgba('#F5F5F5'), mcolors.to_rgba('#AABBC3'), 2.0)
+ACTIVE_NODE_STYLE = (mcolors.to_rgba('#FFB300'), mcolors.to_rgba('#FF8F00'), 3.5)
+INACTIVE_NODE_STYLE = (mcolors.to_rgba('#F0F0F0'), mcolors.to_rgba('#CCCCCC'), 2.5)
+BADGE_STYLE = (mcolors.to_rgba('#03A9F4'), mcolors.to_rgba('#0288D1'), 1.5)
+HIDDEN_BADGE_STYLE = ((0, 0, 0, 0), (0, 0, 0, 0), 0.0)
+BADGE_FONTSIZE = 10
+BADGE_PAD = 0.2
 
 
-def setup_bst_visualization(ax_bst, bst, bst_positions_dict):
+class NodeCircles:
+    """All node markers of a plot, drawn as a single collection (EllipseCollection or scatter)"""
+    def __init__(self, collection, values, style=NODE_STYLE):
+        facecolor, edgecolor, linewidth = style
+        self.collection = collection
+        self.index = {value: i for i, value in enumerate(values)}
+        self.facecolors = np.tile(np.asarray(facecolor, dtype=float), (len(values), 1))
+        self.edgecolors = np.tile(np.asarray(edgecolor, dtype=float), (len(values), 1))
+        self.linewidths = np.full(len(values), linewidth, dtype=float)
+
+    def __contains__(self, value):
+        return value in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def set_style(self, value, style):
+        """Copy a precomputed style row into one node's slot of the backing arrays"""
+        idx = self.index[value]
+        self.facecolors[idx], self.edgecolors[idx], self.linewidths[idx] = style
+
+    def set_all(self, style):
+        """Copy a precomputed style row into every node's slot"""
+        facecolor, edgecolor, linewidth = style
+        self.facecolors[:] = facecolor
+        self.edgecolors[:] = edgecolor
+        self.linewidths[:] = linewidth
+
+    def apply(self):
+        """Push the backing arrays to the collection in one update"""
+        self.collection.set_facecolors(self.facecolors)
+        self.collection.set_edgecolors(self.edgecolors)
+        self.collection.set_linewidths(self.linewidths)
+
+
+class NodeBadges(dict):
+    """
+    Visit-number badges: a dict of node value -> label Text, plus one
+    EllipseCollection of fixed-size discs drawn behind the labels.
+    The labels carry no bbox, so changing a number never re-measures a box.
+    """
+    def __init__(self, labels, discs):
+        super().__init__(labels)
+        self.discs = discs
+
+
+def badge_diameter(max_visit_num):
+    """Disc diameter in points that fits the widest visit number up to max_visit_num"""
+    template = '0' * len(str(max_visit_num))
+    prop = FontProperties(size=BADGE_FONTSIZE, weight='heavy')
+    extents = TextPath((0, 0), template, size=BADGE_FONTSIZE, prop=prop).get_extents()
+    # Same sizing as boxstyle='circle,pad=0.2' around the template string
+    return max(extents.width, extents.height) + 2 * BADGE_PAD * BADGE_FONTSIZE
+
+
+def setup_bst_visualization(ax_bst, bst, bst_positions_dict, max_visit_num=None):
     """
     Draw the complete search tree structure (static setup).
+    All node circles share one EllipseCollection, so the tree is a single
+    artist to draw no matter how many nodes it has. The caller sets the axes
+    limits; the collections are added without touching the data limits.
+    max_visit_num is the largest visit number that will be passed to
+    highlight_node (defaults to the node count); the badges are sized for it.
     """
     if bst.root is None:
         return {}, {}, {}
     
-    node_circles = {}
     node_texts = {}
-    node_badges = {}
-    
-    # Draw edges
-    if bst.root.value in bst_positions_dict:
-        draw_tree_edges(ax_bst, bst.root, bst_positions_dict)
+    badge_labels = {}
+    
+    # Draw edges: gather every parent/child segment with one fancy-indexing pass
+    # over the flattened tree and hand them to a single LineCollection
+    tree_nodes, left, right = bst.to_arrays()
+    xy = np.array([bst_positions_dict.get(node.value, (np.nan, np.nan)) for node in tree_nodes],
+                  dtype=float)
+    idx = np.arange(len(tree_nodes))
+    has_left, has_right = left >= 0, right >= 0
+    parents = np.concatenate([idx[has_left], idx[has_right]])
+    children = np.concatenate([left[has_left], right[has_right]])
+    placed = ~np.isnan(xy[parents, 0]) & ~np.isnan(xy[children, 0])
+    segments = np.stack([xy[parents[placed]], xy[children[placed]]], axis=1)
+    ax_bst.add_collection(LineCollection(segments, colors='#AABBC3', linewidths=2.0,
+                                         zorder=1, alpha=0.7), autolim=False)
     
     # Draw nodes
+    values = list(bst_positions_dict)
+    offsets = np.array(list(bst_positions_dict.values()), dtype=float)
+    circles = EllipseCollection(widths=50, heights=50, angles=0, units='xy',
+                                offsets=offsets, offset_transform=ax_bst.transData,
+                                zorder=5)
+    ax_bst.add_collection(circles, autolim=False)
+    node_circles = NodeCircles(circles, values)
+    node_circles.apply()
+
+    # Badge discs are sized once for the widest visit number and stay
+    # transparent until their node is visited
+    diameter = badge_diameter(max_visit_num or len(values))
+    discs = EllipseCollection(widths=diameter, heights=diameter, angles=0, units='points',
+                              offsets=offsets + 18, offset_transform=ax_bst.transData,
+                              zorder=7)
+    ax_bst.add_collection(discs, autolim=False)
+    badge_discs = NodeCircles(discs, values, style=HIDDEN_BADGE_STYLE)
+    badge_discs.apply()
+
     for value, (x, y) in bst_positions_dict.items():
-        circle = patches.Circle((x, y), 25,
-                               facecolor='#F5F5F5',
-                               edgecolor='#AABBC3',
-                               linewidth=2.0, zorder=5)
-        ax_bst.add_patch(circle)
-        node_circles[value] = circle
-        
         text = ax_bst.text(x, y, str(value), fontsize=14, ha='center', va='center',
                           fontweight='bold', color='#455A64', zorder=6)
         node_texts[value] = text
         
-        badge = ax_bst.text(x + 18, y + 18, "", fontsize=10, ha='center', va='center',
-                           fontweight='heavy', color='#FFFFFF',
-                           bbox=dict(boxstyle='circle,pad=0.2',
-                                    facecolor='#03A9F4', edgecolor='#0288D1',
-                                    alpha=0.0, linewidth=0.0), zorder=7)
-        node_badges[value] = badge
+        badge = ax_bst.text(x + 18, y + 18, "", fontsize=BADGE_FONTSIZE, ha='center',
+                           va='center', fontweight='heavy', color='#FFFFFF',
+                           zorder=8, visible=False)
+        badge_labels[value] = badge
     
-    return node_circles, node_texts, node_badges
+    return node_circles, node_texts, NodeBadges(badge_labels, badge_discs)
 
 
 def highlight_node(node_circles, node_texts, node_badges, node_value, visit_num):
     """Highlight a node when visited"""
     if node_value in node_circles:
-        node_circles[node_value].set_facecolor('#FFB300')
-        node_circles[node_value].set_edgecolor('#FF8F00')
-        node_circles[node_value].set_linewidth(3.5)
+        node_circles.set_style(node_value, ACTIVE_NODE_STYLE)
+        node_circles.apply()
         node_texts[node_value].set_color('#FFFFFF')
         
+        node_badges.discs.set_style(node_value, BADGE_STYLE)
+        node_badges.discs.apply()
         badge = node_badges[node_value]
         badge.set_text(f"{visit_num}")
-        bbox = badge.get_bbox_patch()
-        if bbox:
-            bbox.set_facecolor('#03A9F4')
-            bbox.set_edgecolor('#0288D1')
-            bbox.set_alpha(1.0)
-            bbox.set_linewidth(1.5)
+        badge.set_visible(True)
+
+
+def reset_highlights(node_circles, node_texts, node_badges):
+    """Return every node to the inactive (unvisited) look"""
+    if not node_circles:
+        return
+    
+    node_circles.set_all(INACTIVE_NODE_STYLE)
+    node_circles.apply()
+    node_badges.discs.set_all(HIDDEN_BADGE_STYLE)
+    node_badges.discs.apply()
+    for node_value in node_circles:
+        node_texts[node_value].set_color('#999999')
+        if node_value in node_badges:
+            badge = node_badges[node_value]
+            badge.set_visible(False)
+            badge.set_text("")
 
 # --- 4. Animation/Run Function ---
 
-def animate_traversal(bst, traversal_order_values, node_circles, node_texts, node_badges, fig):
-    """Highlights nodes during traversal"""
+def animate_traversal(bst, traversal_order_values, node_circles, node_texts, node_badges, fig,
+                      update_every=1, interval=700):
+    """
+    Highlights nodes during traversal.
+    Driven by a blitting FuncAnimation instead of a sleep loop, so the GUI
+    event loop stays responsive: the static parts of the tree (edges, title)
+    are cached once and each frame redraws only the node artists.
+    With update_every > 1, every step is still highlighted but a frame is
+    only rendered every update_every steps (and on the last one).
+    
+    Returns the FuncAnimation; the caller must keep a reference to it.
+    """
     print(f"Starting traversal visualization for: {traversal_order_values}")
     
-    for step, node_value in enumerate(traversal_order_values):
-        visit_num = step + 1
-        highlight_node(node_circles, node_texts, node_badges, node_value, visit_num)
-        
-        fig.canvas.draw()
-        fig.canvas.flush_events()
-        time.sleep(0.7)
-    
-    print("Traversal complete.")
+    # Listed in zorder so draw_artist layers them the same way a full draw would
+    node_artists = [node_circles.collection, *node_texts.values(),
+                    node_badges.discs.collection, *node_badges.values()]
+    steps = len(traversal_order_values)
+    frames = [(start, min(start + update_every, steps))
+              for start in range(0, steps, update_every)]
+    
+    def init():
+        return node_artists
+    
+    def update(frame):
+        start, stop = frame
+        for step in range(start, stop):
+            highlight_node(node_circles, node_texts, node_badges,
+                           traversal_order_values[step], step + 1)
+        if stop == steps:
+            # Hand the nodes back to normal drawing so later redraws include them
+            for artist in node_artists:
+                artist.set_animated(False)
+            fig.canvas.draw_idle()
+            print("Traversal complete.")
+        return node_artists
+    
+    return animation.FuncAnimation(fig, update, frames=frames, init_func=init,
+                                   interval=interval, blit=True, repeat=False)
 
 
-def visualize_bst_traversal(all_node_values, traversal_order_values, traversal_name):
+def visualize_bst_traversal(all_node_values, traversal_order_values, traversal_name, update_every=1, ax=None):
     """Main function to set up and run the visualization"""
     bst = create_bst_from_all_nodes(all_node_values)
     if bst is None:
@@ -332,43 +558,41 @@ def visualize_bst_traversal(all_node_values, traversal_order_values, traversal_n
         print("No nodes to display.")
         return
          
-    all_x = [x for v, (x, y) in bst_positions_dict.items()]
-    all_y = [y for v, (x, y) in bst_positions_dict.items()]
+    _, all_x, all_y = layout_to_arrays(positions_list)
+
+    # Reuse the caller's axes when given instead of allocating a new figure
+    if ax is None:
+        fig, ax = plt.subplots(figsize=(12, 8))
+    else:
+        ax.clear()
+        fig = ax.figure
 
-    plt.ion()
-    fig, ax = plt.subplots(figsize=(12, 8))
-    
     ax.set_title(f'BST Traversal Visualization: {traversal_name}', 
                  fontsize=16, fontweight='bold', pad=20)
-    ax.set_xticks([])
-    ax.set_yticks([])
-    ax.spines['top'].set_visible(False)
-    ax.spines['right'].set_visible(False)
-    ax.spines['bottom'].set_visible(False)
-    ax.spines['left'].set_visible(False)
-    
-    x_min, x_max = min(all_x), max(all_x)
-    y_min, y_max = min(all_y), max(all_y)
+    ax.set_axis_off()
+    
+    x_min, x_max = all_x.min(), all_x.max()
+    y_min, y_max = all_y.min(), all_y.max()
+    # Fix the view once from the layout bounds (y inverted so the tree grows
+    # downward); the collections below are added without limit updates
+    ax.set_autoscale_on(False)
     ax.set_xlim(x_min - 50, x_max + 50)
-    ax.set_ylim(y_min - 50, y_max + 50)
-    ax.invert_yaxis()
+    ax.set_ylim(y_max + 50, y_min - 50)
 
-    node_circles, node_texts, node_badges = setup_bst_visualization(ax, bst, bst_positions_dict)
+    node_circles, node_texts, node_badges = setup_bst_visualization(
+        ax, bst, bst_positions_dict, max_visit_num=len(traversal_order_values))
 
-    fig.canvas.draw()
-    fig.canvas.flush_events()
-    time.sleep(1)
-    
-    animate_traversal(bst, traversal_order_values, node_circles, node_texts, node_badges, fig)
+    anim = animate_traversal(bst, traversal_order_values, node_circles, node_texts,
+                             node_badges, fig, update_every=update_every)
     
-    plt.ioff()
     plt.show()
+    return anim
 
 # --- 5. Example Usage ---
 
 if __name__ == '__main__':
     ALL_NODES = [50, 30, 70, 20, 40, 60, 80, 15, 25, 35, 45, 55, 65, 75, 85]
-    INORDER_TRAVERSAL = [15, 20, 25, 30, 35, 40, 45, 50, 55, 60, 65, 70, 75, 80, 85]
+    INORDER_TRAVERSAL = create_bst_from_all_nodes(ALL_NODES).inorder_traversal()
 
     print("--- Running In-order Traversal Visualization ---")
     visualize_bst_traversal(
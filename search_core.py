@@ -0,0 +1,805 @@
+import math
+import re
+from collections import deque
+import heapq
+import numpy as np
+
+# ------------------------------
+# LOAD GRAPH DATA
+# ------------------------------
+# Problem file patterns: section headers, `name: (x,y)` nodes and `(a,b): cost` edges.
+# Names may contain inner spaces; blanks around every field are trimmed by the match.
+SECTION_RE = re.compile(r'^[ \t]*(Nodes|Edges|Origin|Destinations):.*$', re.M)
+NODE_RE = re.compile(r'^[ \t]*([^:\n]*[^:\s])[ \t]*:[ \t]*\([ \t]*([^,\s]+)[ \t]*,[ \t]*([^)\s]+)[ \t]*\)', re.M)
+EDGE_RE = re.compile(r'^[ \t]*\([ \t]*([^,\n]*[^,\s])[ \t]*,[ \t]*([^)\n]*[^)\s])[ \t]*\)[ \t]*:[ \t]*(\S+)', re.M)
+
+
+def load_problem(filename):
+    """
+    Parse a problem file in one pass over its text: the section headers
+    split the file, then each section body is matched with a precompiled
+    regex instead of a split/strip chain per line.
+    Raises ValueError naming the first non-blank node or edge line that
+    does not match, rather than silently leaving it out of the graph.
+    """
+    nodes, edges, origin, destinations = {}, {}, None, []
+    
+    with open(filename, 'r') as f:
+        text = f.read()
+
+    # re.split yields [preamble, header, body, header, body, ...]
+    parts = SECTION_RE.split(text)
+    for section, body in zip(parts[1::2], parts[2::2]):
+        if section in ('Nodes', 'Edges'):
+            # Each match is anchored to the start of its own line, so fewer
+            # matches than non-blank lines means some line is malformed
+            pattern = NODE_RE if section == 'Nodes' else EDGE_RE
+            rows = pattern.findall(body)
+            lines = [line for line in body.splitlines() if line.strip()]
+            if len(rows) != len(lines):
+                bad = next(line for line in lines if not pattern.match(line))
+                raise ValueError(f"{filename}: malformed line in {section} section: {bad.strip()!r}")
+        if section == 'Nodes':
+            for node, x, y in rows:
+                nodes[node] = (float(x), float(y))
+        elif section == 'Edges':
+            for a, b, cost in rows:
+                edges.setdefault(a, []).append((b, float(cost)))
+        else:
+            lines = [line.strip() for line in body.splitlines() if line.strip()]
+            if not lines:
+                continue
+            if section == 'Origin':
+                origin = lines[-1]
+            else:
+                destinations = [d.strip() for d in lines[-1].split(";")]
+
+    return nodes, edges, origin, destinations
+
+# ------------------------------
+# HEURISTIC FUNCTION
+# ------------------------------
+def heuristic(a, b, nodes):
+    """
+    Calculate heuristic distance from node a to goal b.
+    If b is a list of goals, returns minimum distance to any goal.
+    """
+    (x1, y1) = nodes[a]
+    
+    # Handle single goal (string) or multiple goals (list)
+    if isinstance(b, str):
+        (x2, y2) = nodes[b]
+        return math.sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2)
+    else:
+        # b is a list of goals - return minimum distance to any goal
+        min_distance = float('inf')
+        for goal in b:
+            (x2, y2) = nodes[goal]
+            distance = math.sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2)
+            min_distance = min(min_distance, distance)
+        return min_distance
+
+# ------------------------------
+# INTERNED GRAPH (INT IDS FOR THE SEARCH LOOPS)
+# ------------------------------
+def intern_graph(edges, nodes=None, extra=()):
+    """
+    Map node names to int ids so the search loops index lists and
+    bytearrays instead of hashing strings.
+    Ids follow sorted name order, so comparing two ids (e.g. heap
+    tie-breaks) orders nodes exactly as comparing their names did.
+    Returns (names, ids, adjacency, xs, ys): adjacency[i] lists
+    (neighbor_id, cost) sorted by neighbour name, then cost, so the searches
+    expand neighbours in order without re-sorting on every expansion (DFS
+    walks the list in reverse) whatever order the caller's edges are in;
+    xs/ys are NumPy coordinate arrays by id (None when nodes is None).
+    """
+    names = set(edges).union(extra)
+    for neighbors in edges.values():
+        names.update(dest for dest, _ in neighbors)
+    if nodes:
+        names.update(nodes)
+    names = sorted(names)
+    ids = {name: i for i, name in enumerate(names)}
+    
+    adjacency = [[] for _ in names]
+    for src, neighbors in edges.items():
+        adjacency[ids[src]] = sorted((ids[dest], cost) for dest, cost in neighbors)
+    
+    xs = ys = None
+    if nodes:
+        xs = np.fromiter((nodes[name][0] for name in names), dtype=float, count=len(names))
+        ys = np.fromiter((nodes[name][1] for name in names), dtype=float, count=len(names))
+    return names, ids, adjacency, xs, ys
+
+
+def reverse_adjacency(adjacency):
+    """Incoming edges per id: reverse[i] lists (source_id, cost) for every edge into i"""
+    reverse = [[] for _ in adjacency]
+    for src, neighbors in enumerate(adjacency):
+        for dest, cost in neighbors:
+            reverse[dest].append((src, cost))
+    return reverse
+
+
+def prepare_search(edges, nodes, start, goals, squared=False):
+    """
+    Intern the graph for one search run.
+    Returns (names, adjacency, h_table, start_id, is_goal) where is_goal is
+    a bytearray flag per id and h_table lists every node's heuristic by id
+    (None when nodes is None, i.e. for the uninformed searches).
+    squared is passed through to heuristic_table.
+    """
+    names, ids, adjacency, xs, ys = intern_graph(edges, nodes, (start, *goals))
+    goal_ids = [ids[goal] for goal in goals]
+    is_goal = bytearray(len(names))
+    for goal_id in goal_ids:
+        is_goal[goal_id] = 1
+    h_table = heuristic_table(xs, ys, goal_ids, squared) if nodes else None
+    return names, adjacency, h_table, ids[start], is_goal
+
+
+def heuristic_table(xs, ys, goal_ids, squared=False):
+    """
+    heuristic() for every node at once: straight-line distance to the
+    nearest goal, computed in one vectorized NumPy pass over all nodes.
+    Same arithmetic as heuristic(), so the values are bit-identical.
+    With squared=True the sqrt is skipped; the values then only keep
+    heuristic()'s ordering and must not be added to path costs.
+    """
+    if not goal_ids:
+        return [math.inf] * len(xs)
+    dx = xs[:, None] - xs[goal_ids]
+    dy = ys[:, None] - ys[goal_ids]
+    dist2 = (dx ** 2 + dy ** 2).min(axis=1)
+    return dist2.tolist() if squared else np.sqrt(dist2).tolist()
+
+# ------------------------------
+# PATH RECONSTRUCTION
+# ------------------------------
+def reconstruct_path(parents, parent, node, names):
+    """
+    Rebuild the start -> node path (as names) for a frontier entry reached
+    from `parent`. `parents[i]` is the id node i was expanded from (-1 for
+    the start), so the path is built once at the goal instead of copied on
+    every push.
+    """
+    path = [names[node]]
+    while parent >= 0:
+        path.append(names[parent])
+        parent = parents[parent]
+    path.reverse()
+    return path
+
+
+def named_order(visited_order, names):
+    """Translate an id-based visited_order back to (node, parent) name tuples"""
+    return [(names[node], names[parent] if parent >= 0 else None)
+            for node, parent in visited_order]
+
+# ------------------------------
+# PRINT RESULTS
+# ------------------------------
+def print_results(filename, method, goal, num_nodes, path):
+    print(f"{filename} {method}")
+    print(f"{goal} {num_nodes}")
+    print(" -> ".join(path))
+
+# ------------------------------
+# SEARCH ALGORITHMS
+# ------------------------------
+# Every search logs its expansions as visited_order for the visualizer.
+# Pass record=False when only the result is needed: the log is skipped and
+# an empty visited_order is returned.
+def dfs(edges, start, goal, record=True):
+    names, adjacency, _, start_id, is_goal = prepare_search(edges, None, start, goal)
+    stack = [(start_id, -1)]
+    visited = bytearray(len(names))
+    parents = [-1] * len(names)
+    visited_order = []
+    count = 0
+
+    while stack:
+        node, parent = stack.pop()
+        count += 1
+        if visited[node]:
+            continue
+        if record:
+            visited_order.append((node, parent))
+
+        if is_goal[node]:
+            return (names[node], count, reconstruct_path(parents, parent, node, names),
+                    named_order(visited_order, names))
+
+        visited[node] = 1
+        parents[node] = parent
+        for neighbor, _ in reversed(adjacency[node]):
+            if not visited[neighbor]:
+                stack.append((neighbor, node))
+
+    return None, count, [], named_order(visited_order, names)
+
+
+def bfs(edges, start, goal, record=True):
+    names, adjacency, _, start_id, is_goal = prepare_search(edges, None, start, goal)
+    queue = deque([(start_id, -1)])
+    visited = bytearray(len(names))
+    parents = [-1] * len(names)
+    visited_order = []
+    count = 0
+
+    while queue:
+        node, parent = queue.popleft()
+        count += 1
+        if visited[node]:
+            continue
+        if record:
+            visited_order.append((node, parent))
+
+        if is_goal[node]:  # only the start; other goals are caught on enqueue
+            return (names[node], count, reconstruct_path(parents, parent, node, names),
+                    named_order(visited_order, names))
+
+        visited[node] = 1
+        parents[node] = parent
+        for neighbor, _ in adjacency[node]:
+            if not visited[neighbor]:
+                # The queue is FIFO, so the first goal enqueued is the one that
+                # would be popped first: return it now, counted as its pop
+                if is_goal[neighbor]:
+                    count += 1
+                    if record:
+                        visited_order.append((neighbor, node))
+                    return (names[neighbor], count, reconstruct_path(parents, node, neighbor, names),
+                            named_order(visited_order, names))
+                queue.append((neighbor, node))
+
+    return None, count, [], named_order(visited_order, names)
+
+
+def gbfs(nodes, edges, start, goals, record=True):
+    # goals can be a list of goal nodes
+    # GBFS only orders by h, so squared distances give the same expansions
+    names, adjacency, h_table, start_id, is_goal = prepare_search(edges, nodes, start, goals, squared=True)
+    frontier = []
+    h_start = h_table[start_id]
+    heapq.heappush(frontier, (h_start, start_id, -1))
+    # A node can be queued by several parents; the entry popped first (lowest
+    # parent id on equal h) decides its parent, later ones are skipped as visited
+    visited = bytearray(len(names))
+    parents = [-1] * len(names)
+    visited_order = []
+    count = 0
+
+    while frontier:
+        _, node, parent = heapq.heappop(frontier)
+        count += 1
+        if visited[node]:
+            continue
+        if record:
+            visited_order.append((node, parent))
+
+        if is_goal[node]:
+            return (names[node], count, reconstruct_path(parents, parent, node, names),
+                    named_order(visited_order, names))
+
+        visited[node] = 1
+        parents[node] = parent
+        for neighbor, _ in adjacency[node]:
+            if not visited[neighbor]:
+                h = h_table[neighbor]
+                heapq.heappush(frontier, (h, neighbor, node))
+
+    return None, count, [], named_order(visited_order, names)
+
+
+def astar(nodes, edges, start, goals, record=True):
+    # goals can be a list of goal nodes
+    names, adjacency, h_table, start_id, is_goal = prepare_search(edges, nodes, start, goals)
+    frontier = []
+    h_start = h_table[start_id]
+    heapq.heappush(frontier, (h_start, 0, start_id, -1))
+    best_g = [math.inf] * len(names)  # best g pushed so far, per node
+    best_g[start_id] = 0
+    parents = [-1] * len(names)
+    visited_order = []
+    count = 0
+
+    while frontier:
+        f, g, node, parent = heapq.heappop(frontier)
+        count += 1
+        if g > best_g[node]:
+            continue  # stale entry, a cheaper one was pushed later
+        if record:
+            visited_order.append((node, parent))
+
+        if is_goal[node]:
+            return (names[node], count, reconstruct_path(parents, parent, node, names),
+                    named_order(visited_order, names))
+
+        parents[node] = parent
+        for neighbor, cost in adjacency[node]:
+            g2 = g + cost
+            if g2 < best_g[neighbor]:
+                best_g[neighbor] = g2
+                h = h_table[neighbor]
+                f2 = g2 + h
+                heapq.heappush(frontier, (f2, g2, neighbor, node))
+
+    return None, count, [], named_order(visited_order, names)
+
+# ------------------------------
+# CUSTOM UNINFORMED SEARCH (CUS1) – UNIFORM COST SEARCH WITH TIE-BREAKING BY HEURISTIC
+# ------------------------------
+# Description:
+#   - Uniform Cost Search with Tie-Breaking by Heuristic is a cost-prioritized search that
+#     expands nodes with the lowest cumulative cost first (like UCS/Dijkstra).
+#   - When two nodes have equal cost, the heuristic is used as a tiebreaker to guide the search.
+#   - This combines the optimality guarantee of UCS with some heuristic guidance.
+# 
+# Characteristics:
+#   • Type: Hybrid (uninformed primary, heuristic as tiebreaker)
+#   • Strategy: Expands lowest g(n), uses h(n) to break ties
+#   • Optimal: Yes (if all edge costs are non-negative)
+#   • Complete: Yes
+#
+# Implementation Details:
+#   - A priority queue (heap) is used to expand nodes by cost first, heuristic second.
+#   - The frontier stores tuples of (cost, heuristic, node, parent); paths are rebuilt from parent links.
+#   - When costs are equal, nodes closer to goal (lower h) are expanded first.
+#   - Guarantees optimal solution like UCS, but explores fewer nodes due to heuristic guidance.
+def ucs_with_heuristic_tiebreak(nodes, edges, start, goals, record=True):
+    # goals can be a list of goal nodes
+    names, adjacency, h_table, start_id, is_goal = prepare_search(edges, nodes, start, goals)
+    frontier = [(0, 0, start_id, -1)]
+    visited = bytearray(len(names))
+    best_cost = [math.inf] * len(names)  # best cost pushed so far, per node
+    best_cost[start_id] = 0
+    parents = [-1] * len(names)
+    visited_order = []
+    count = 0
+
+    while frontier:
+        cost, h, node, parent = heapq.heappop(frontier)
+        count += 1
+        if visited[node]:
+            continue
+        if record:
+            visited_order.append((node, parent))
+
+        if is_goal[node]:
+            return (names[node], count, reconstruct_path(parents, parent, node, names),
+                    named_order(visited_order, names))
+
+        visited[node] = 1
+        parents[node] = parent
+        for neighbor, edge_cost in adjacency[node]:
+            new_cost = cost + edge_cost
+            if not visited[neighbor] and new_cost < best_cost[neighbor]:
+                best_cost[neighbor] = new_cost
+                h_neighbor = h_table[neighbor]
+                heapq.heappush(frontier, (new_cost, h_neighbor, neighbor, node))
+
+    return None, count, [], named_order(visited_order, names)
+
+def custom_uninformed(nodes, edges, start, goals, record=True):
+    # Wrapper for the CUS1 algorithm
+    # Calls Uniform Cost Search with Tie-Breaking by Heuristic
+    # goals is already a list, no conversion needed
+    return ucs_with_heuristic_tiebreak(nodes, edges, start, goals, record=record)
+
+# ------------------------------
+# CUSTOM INFORMED SEARCH (CUS2) – WEIGHTED A* SEARCH
+# ------------------------------
+# Description:
+#   - Weighted A* is a variant of A* search that uses a weighted heuristic function:
+#         f(n) = g(n) + w * h(n)
+#     where:
+#         g(n) = actual cost from start to current node
+#         h(n) = estimated cost from current node to goal
+#         w    = weight factor (>1) that biases the search toward the heuristic.
+#   - When w = 1, it behaves like normal A*.
+#   - When w > 1, it becomes greedier (faster but less optimal).
+#
+# Characteristics:
+#   • Type: Informed
+#   • Strategy: Balances actual and estimated cost based on the weight factor
+#   • Optimal: Not guaranteed (for w > 1)
+#   • Complete: Yes (for consistent heuristic)
+#
+# Implementation Details:
+#   - Uses a priority queue ordered by the weighted f(n) value.
+#   - Can trade accuracy for speed depending on the weight chosen.
+#   - Ideal for large graphs where exact optimality is less important than faster performance.
+def weighted_astar(nodes, edges, start, goals, weight=1.5, record=True):
+    # goals can be a list of goal nodes
+    names, adjacency, h_table, start_id, is_goal = prepare_search(edges, nodes, start, goals)
+    frontier = [(0, 0, start_id, -1)]
+    best_g = [math.inf] * len(names)  # best g pushed so far, per node
+    best_g[start_id] = 0
+    parents = [-1] * len(names)
+    visited_order = []
+    count = 0
+
+    while frontier:
+        f, g, node, parent = heapq.heappop(frontier)
+        count += 1
+        if g > best_g[node]:
+            continue  # stale entry, a cheaper one was pushed later
+        if record:
+            visited_order.append((node, parent))
+
+        if is_goal[node]:
+            return (names[node], count, reconstruct_path(parents, parent, node, names),
+                    named_order(visited_order, names))
+
+        parents[node] = parent
+        for neighbor, cost in adjacency[node]:
+            g2 = g + cost
+            if g2 < best_g[neighbor]:
+                best_g[neighbor] = g2
+                h = h_table[neighbor]
+                f2 = g2 + weight * h
+                heapq.heappush(frontier, (f2, g2, neighbor, node))
+
+    return None, count, [], named_order(visited_order, names)
+
+
+def custom_informed(nodes, edges, start, goals, record=True):
+    # Wrapper for the CUS2 algorithm
+    # Calls the Weighted A* implementation with weight = 1.5
+    # goals is already a list, no conversion needed
+    return weighted_astar(nodes, edges, start, goals, weight=1.5, record=record)
+
+# ------------------------------
+# BIDIRECTIONAL A* SEARCH
+# ------------------------------
+# Description:
+#   - Runs one A* forward from the start (h = distance to the nearest goal) and one
+#     backward over reversed edges from every goal at once (h = distance to the start).
+#   - Each step expands the side whose frontier has the smaller f value.
+#   - Whenever a relaxed node has already been reached by the other side, the joined
+#     path cost g_forward + g_backward is a candidate; mu keeps the cheapest one.
+#
+# Implementation Details:
+#   - Stops once either frontier's smallest f is >= mu: with an admissible heuristic no
+#     unexplored path on that side can beat mu any more.
+#   - Same lazy-deletion frontier as astar(); parents are recorded when a cheaper g is
+#     pushed, so the meeting node can be reached before it is expanded.
+#   - visited_order lists expansions from both sides; backward entries name the
+#     successor they were reached from as their parent.
+def astar_bidirectional(nodes, edges, start, goals, record=True):
+    names, ids, adjacency, xs, ys = intern_graph(edges, nodes, (start, *goals))
+    start_id = ids[start]
+    goal_ids = [ids[goal] for goal in goals]
+    n = len(names)
+    adjacencies = (adjacency, reverse_adjacency(adjacency))
+    h_tables = (heuristic_table(xs, ys, goal_ids), heuristic_table(xs, ys, [start_id]))
+    best_g = ([math.inf] * n, [math.inf] * n)
+    parents = ([-1] * n, [-1] * n)
+    frontiers = ([], [])
+    best_g[0][start_id] = 0
+    heapq.heappush(frontiers[0], (h_tables[0][start_id], 0, start_id))
+    for goal_id in goal_ids:
+        best_g[1][goal_id] = 0
+        heapq.heappush(frontiers[1], (h_tables[1][goal_id], 0, goal_id))
+    visited_order = []
+    count = 0
+
+    mu, meet = (0, start_id) if best_g[1][start_id] == 0 else (math.inf, -1)
+    while frontiers[0] and frontiers[1]:
+        top_forward, top_backward = frontiers[0][0][0], frontiers[1][0][0]
+        if max(top_forward, top_backward) >= mu:
+            break
+        side = 0 if top_forward <= top_backward else 1
+        _, g, node = heapq.heappop(frontiers[side])
+        count += 1
+        g_side, g_other = best_g[side], best_g[1 - side]
+        if g > g_side[node]:
+            continue  # stale entry, a cheaper one was pushed later
+        if record:
+            visited_order.append((node, parents[side][node]))
+
+        h_side, parents_side, frontier = h_tables[side], parents[side], frontiers[side]
+        for neighbor, cost in adjacencies[side][node]:
+            g2 = g + cost
+            if g2 < g_side[neighbor]:
+                g_side[neighbor] = g2
+                parents_side[neighbor] = node
+                heapq.heappush(frontier, (g2 + h_side[neighbor], g2, neighbor))
+                if g2 + g_other[neighbor] < mu:
+                    mu, meet = g2 + g_other[neighbor], neighbor
+
+    if meet < 0:
+        return None, count, [], named_order(visited_order, names)
+
+    path = reconstruct_path(parents[0], parents[0][meet], meet, names)
+    node = parents[1][meet]
+    while node >= 0:
+        path.append(names[node])
+        node = parents[1][node]
+    return path[-1], count, path, named_order(visited_order, names)
+
+# ------------------------------
+# BIDIRECTIONAL BREADTH-FIRST SEARCH
+# ------------------------------
+# Description:
+#   - Breadth-first search run forward from the start and backward over reversed
+#     edges from every goal at once; edge costs are ignored, as in bfs().
+#   - Each round expands one whole level of the smaller frontier, so the two
+#     searches meet in the middle after about b^(d/2) expansions per side.
+#
+# Implementation Details:
+#   - A neighbour already reached by the other side joins the two searches; the
+#     level is finished and the meeting with the fewest edges is kept, which
+#     gives the same number of steps as bfs() (ties may pick another path).
+#   - visited_order lists expansions from both sides; backward entries name the
+#     successor they were reached from as their parent.
+def bfs_bidirectional(edges, start, goals, record=True):
+    names, ids, adjacency, _, _ = intern_graph(edges, None, (start, *goals))
+    start_id = ids[start]
+    n = len(names)
+    adjacencies = (adjacency, reverse_adjacency(adjacency))
+    depth = ([-1] * n, [-1] * n)
+    parents = ([-1] * n, [-1] * n)
+    frontiers = ([start_id], [])
+    depth[0][start_id] = 0
+    for goal in goals:
+        goal_id = ids[goal]
+        if depth[1][goal_id] < 0:
+            depth[1][goal_id] = 0
+            frontiers[1].append(goal_id)
+    visited_order = []
+    count = 0
+
+    best, meet = (0, start_id) if depth[1][start_id] == 0 else (math.inf, -1)
+    while meet < 0 and frontiers[0] and frontiers[1]:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        depth_side, depth_other = depth[side], depth[1 - side]
+        parents_side, neighbors_of = parents[side], adjacencies[side]
+        next_level = []
+        for node in frontiers[side]:
+            count += 1
+            if record:
+                visited_order.append((node, parents_side[node]))
+            level = depth_side[node] + 1
+            for neighbor, _ in neighbors_of[node]:
+                if depth_side[neighbor] < 0:
+                    depth_side[neighbor] = level
+                    parents_side[neighbor] = node
+                    next_level.append(neighbor)
+                    if depth_other[neighbor] >= 0 and level + depth_other[neighbor] < best:
+                        best, meet = level + depth_other[neighbor], neighbor
+        frontiers[side][:] = next_level
+
+    if meet < 0:
+        return None, count, [], named_order(visited_order, names)
+
+    path = reconstruct_path(parents[0], parents[0][meet], meet, names)
+    node = parents[1][meet]
+    while node >= 0:
+        path.append(names[node])
+        node = parents[1][node]
+    return path[-1], count, path, named_order(visited_order, names)
+
+# ------------------------------
+# MULTI-GOAL SEARCH (Sequential Visualization Support)
+# ------------------------------
+def bfs_all(edges, start, goals, record=True):
+    """Breadth-first search variant that finds all goal paths."""
+    names, adjacency, _, start_id, is_goal = prepare_search(edges, None, start, goals)
+    queue = deque([(start_id, -1)])
+    visited = bytearray(len(names))
+    parents = [-1] * len(names)
+    visited_order = []
+    found_paths = {}  # goal -> path
+    count = 0
+
+    while queue:
+        node, parent = queue.popleft()
+        count += 1
+        if visited[node]:
+            continue
+        if record:
+            visited_order.append((node, parent))
+
+        if is_goal[node] and names[node] not in found_paths:
+            found_paths[names[node]] = reconstruct_path(parents, parent, node, names)
+            # Optional: stop if all goals found
+            if len(found_paths) == len(goals):
+                break
+
+        visited[node] = 1
+        parents[node] = parent
+        for neighbor, _ in adjacency[node]:
+            if not visited[neighbor]:
+                queue.append((neighbor, node))
+
+    return found_paths, count, named_order(visited_order, names)
+
+
+def dfs_all(edges, start, goals, record=True):
+    """Depth-first search variant that finds all goal paths."""
+    names, adjacency, _, start_id, is_goal = prepare_search(edges, None, start, goals)
+    stack = [(start_id, -1)]
+    visited = bytearray(len(names))
+    parents = [-1] * len(names)
+    visited_order = []
+    found_paths = {}
+    count = 0
+
+    while stack:
+        node, parent = stack.pop()
+        count += 1
+        if visited[node]:
+            continue
+        if record:
+            visited_order.append((node, parent))
+
+        if is_goal[node] and names[node] not in found_paths:
+            found_paths[names[node]] = reconstruct_path(parents, parent, node, names)
+            if len(found_paths) == len(goals):
+                break
+
+        visited[node] = 1
+        parents[node] = parent
+        for neighbor, _ in reversed(adjacency[node]):
+            if not visited[neighbor]:
+                stack.append((neighbor, node))
+
+    return found_paths, count, named_order(visited_order, names)
+
+
+def gbfs_all(nodes, edges, start, goals, record=True):
+    """Greedy Best-First variant for multiple goals."""
+    # Ordering only, as in gbfs(): squared distances are enough
+    names, adjacency, h_table, start_id, is_goal = prepare_search(edges, nodes, start, goals, squared=True)
+    frontier = []
+    h_start = h_table[start_id]
+    heapq.heappush(frontier, (h_start, start_id, -1))
+    # A node can be queued by several parents; the entry popped first (lowest
+    # parent id on equal h) decides its parent, later ones are skipped as visited
+    visited = bytearray(len(names))
+    parents = [-1] * len(names)
+    visited_order = []
+    found_paths = {}
+    count = 0
+
+    while frontier:
+        _, node, parent = heapq.heappop(frontier)
+        count += 1
+        if visited[node]:
+            continue
+        if record:
+            visited_order.append((node, parent))
+
+        if is_goal[node] and names[node] not in found_paths:
+            found_paths[names[node]] = reconstruct_path(parents, parent, node, names)
+            if len(found_paths) == len(goals):
+                break
+
+        visited[node] = 1
+        parents[node] = parent
+        for neighbor, _ in adjacency[node]:
+            if not visited[neighbor]:
+                h = h_table[neighbor]
+                heapq.heappush(frontier, (h, neighbor, node))
+
+    return found_paths, count, named_order(visited_order, names)
+
+
+def astar_all(nodes, edges, start, goals, record=True):
+    """A* variant that finds all goal paths before stopping."""
+    names, adjacency, h_table, start_id, is_goal = prepare_search(edges, nodes, start, goals)
+    frontier = []
+    h_start = h_table[start_id]
+    heapq.heappush(frontier, (h_start, 0, start_id, -1))
+    best_g = [math.inf] * len(names)  # best g pushed so far, per node
+    best_g[start_id] = 0
+    parents = [-1] * len(names)
+    visited_order = []
+    found_paths = {}
+    count = 0
+
+    while frontier:
+        f, g, node, parent = heapq.heappop(frontier)
+        count += 1
+        if g > best_g[node]:
+            continue  # stale entry, a cheaper one was pushed later
+        if record:
+            visited_order.append((node, parent))
+
+        if is_goal[node] and names[node] not in found_paths:
+            found_paths[names[node]] = reconstruct_path(parents, parent, node, names)
+            if len(found_paths) == len(goals):
+                break
+
+        parents[node] = parent
+        for neighbor, cost in adjacency[node]:
+            g2 = g + cost
+            if g2 < best_g[neighbor]:
+                best_g[neighbor] = g2
+                h = h_table[neighbor]
+                f2 = g2 + h
+                heapq.heappush(frontier, (f2, g2, neighbor, node))
+
+    return found_paths, count, named_order(visited_order, names)
+
+def ucs_with_heuristic_tiebreak_all(nodes, edges, start, goals, record=True):
+    """
+    UCS with heuristic tiebreak — multi-goal variant.
+    Returns: found_paths (dict goal->path), count, visited_order
+    """
+    names, adjacency, h_table, start_id, is_goal = prepare_search(edges, nodes, start, goals)
+    frontier = [(0, 0, start_id, -1)]
+    visited = bytearray(len(names))
+    best_cost = [math.inf] * len(names)  # best cost pushed so far, per node
+    best_cost[start_id] = 0
+    parents = [-1] * len(names)
+    visited_order = []
+    found_paths = {}
+    count = 0
+
+    while frontier:
+        cost, h, node, parent = heapq.heappop(frontier)
+        count += 1
+        if visited[node]:
+            continue
+        if record:
+            visited_order.append((node, parent))
+
+        # If node is any of the goals and not already recorded, save its path
+        if is_goal[node] and names[node] not in found_paths:
+            found_paths[names[node]] = reconstruct_path(parents, parent, node, names)
+            if len(found_paths) == len(goals):
+                break
+
+        visited[node] = 1
+        parents[node] = parent
+        for neighbor, edge_cost in adjacency[node]:
+            new_cost = cost + edge_cost
+            if not visited[neighbor] and new_cost < best_cost[neighbor]:
+                best_cost[neighbor] = new_cost
+                h_neighbor = h_table[neighbor]
+                heapq.heappush(frontier, (new_cost, h_neighbor, neighbor, node))
+
+    return found_paths, count, named_order(visited_order, names)
+
+
+def weighted_astar_all(nodes, edges, start, goals, weight=1.5, record=True):
+    """
+    Weighted A* multi-goal variant (CUS2).
+    Returns: found_paths (dict goal->path), count, visited_order
+    """
+    names, adjacency, h_table, start_id, is_goal = prepare_search(edges, nodes, start, goals)
+    frontier = [(0, 0, start_id, -1)]
+    best_g = [math.inf] * len(names)  # best g pushed so far, per node
+    best_g[start_id] = 0
+    parents = [-1] * len(names)
+    visited_order = []
+    found_paths = {}
+    count = 0
+
+    while frontier:
+        f, g, node, parent = heapq.heappop(frontier)
+        count += 1
+        if g > best_g[node]:
+            continue  # stale entry, a cheaper one was pushed later
+        if record:
+            visited_order.append((node, parent))
+
+        if is_goal[node] and names[node] not in found_paths:
+            found_paths[names[node]] = reconstruct_path(parents, parent, node, names)
+            if len(found_paths) == len(goals):
+                break
+
+        parents[node] = parent
+        for neighbor, cost in adjacency[node]:
+            g2 = g + cost
+            if g2 < best_g[neighbor]:
+                best_g[neighbor] = g2
+                h = h_table[neighbor]
+                f2 = g2 + weight * h
+                heapq.heappush(frontier, (f2, g2, neighbor, node))
+
+    return found_paths, count, named_order(visited_order, names)